@@ -61,6 +61,10 @@
  */
 
 #define DEF_PACKET_SIZE  (64UL * 1024UL)
+#define ERR_PACKET_SIZE  (8UL * 1024UL)
+
+/* Maximum number of queued blocks handed to writev() at once */
+#define MAX_WRITE_BLOCKS 16
 
 enum {
   PROP_0,
@@ -394,8 +398,8 @@ dispatch_error (gint fd,
     {
       g_debug ("%s: reading error", priv->name);
 
-      g_byte_array_set_size (priv->err_buffer, len + 1024);
-      ret = read (priv->err_fd, priv->err_buffer->data + len, 1024);
+      g_byte_array_set_size (priv->err_buffer, len + ERR_PACKET_SIZE);
+      ret = read (priv->err_fd, priv->err_buffer->data + len, ERR_PACKET_SIZE);
       if (ret < 0)
         {
           g_byte_array_set_size (priv->err_buffer, len);
@@ -540,7 +544,7 @@ dispatch_output (gint fd,
 {
   CockpitPipe *self = (CockpitPipe *)user_data;
   CockpitPipePrivate *priv = cockpit_pipe_get_instance_private (self);
-  struct iovec iov[4];
+  struct iovec iov[MAX_WRITE_BLOCKS];
   gsize partial, size, before;
   GBytes *popped;
   gssize ret;
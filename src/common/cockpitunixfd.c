@@ -213,6 +213,38 @@ fdwalk (int (*cb)(void *data, int fd), void *data)
 
 #endif /* HAVE_FDWALK */
 
+#ifdef HAVE_CLOSE_RANGE
+static int
+close_ranges (CloseAll *ca)
+{
+  int from = MAX (ca->from, 0);
+
+  if (ca->except >= from && ca->except < ca->until)
+    {
+      if (ca->except > from && close_range (from, ca->except - 1, 0) < 0)
+        return -1;
+      from = ca->except + 1;
+    }
+
+  if (from < ca->until && close_range (from, ca->until - 1, 0) < 0)
+    return -1;
+
+  return 0;
+}
+#endif /* HAVE_CLOSE_RANGE */
+
+static int
+close_all (CloseAll *ca)
+{
+#ifdef HAVE_CLOSE_RANGE
+  /* Kernels before 5.9 don't have close_range(), so walk the open fds instead */
+  if (close_ranges (ca) == 0)
+    return 0;
+#endif
+
+  return fdwalk (closefd, ca);
+}
+
 /**
  * cockpit_unix_fd_close_all:
  * @from: minimum FD to close, or -1
@@ -230,7 +262,7 @@ cockpit_unix_fd_close_all (int from,
                            int except)
 {
   CloseAll ca = { from, except, G_MAXINT };
-  return fdwalk (closefd, &ca);
+  return close_all (&ca);
 }
 
 /**
@@ -252,5 +284,5 @@ cockpit_unix_fd_close_until (int from,
                              int until)
 {
   CloseAll ca = { from, except, until };
-  return fdwalk (closefd, &ca);
+  return close_all (&ca);
 }